@@ -8,30 +8,145 @@ Email: diwas.puri@duke.edu
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+import asyncio
+import urllib3
 import concurrent.futures
+import multiprocessing
+import threading
+import http.client
+import io
+import itertools
+import re
+import html
 import time
 import os
 import csv
+import gzip
+import orjson
 import pickle
 import argparse
 from pathlib import Path
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
+from lxml import etree
+from lxml import html as lhtml
 
 # Configuration
 BASE_URL = "https://ybio-brillonline-com.proxy.lib.duke.edu/ybio"
 OUTPUT_DIR = "data/raw_chunks"
-MAX_WORKERS = 5  # Be gentle with the server
+# Concurrency = throughput x latency (Little's Law). Estimated from ~500ms per
+# request through the Duke proxy and browsers' 6-per-host limit, not measured;
+# going above 8 is expected to trigger the proxy's rate limiting.
+DEFAULT_WORKERS = 6
+RATE_LIMIT_WORKERS = 8
 MAX_RETRIES = 3
 TIMEOUT = 30
+CHUNK_SIZE = 10  # Pages per saved chunk
+WRITE_BUFFER = 1 << 20  # 1 MiB, so a chunk is written in a few large syscalls
+HTTP2_CONNECTIONS = 4  # Cap only; requests share one HTTP/2 connection until its streams run out
+
+RETRY = object()  # Returned by parse_response when the page should be fetched again
+
+# Byte markers around the results table, used to skip parsing the page chrome
+TABLE_START = b'<table class="views-table'
+TABLE_END = b'</table>'
+
+# The results table has a fixed shape, so rows and cells can be matched directly
+TR_RE = re.compile(r'<tr[^>]*>(.*?)</tr>', re.S)
+TD_RE = re.compile(r'<td[^>]*>(.*?)</td>', re.S)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Full-page fallback, evaluated in C by libxml2. Its HTML parser doesn't insert
+# a missing <tbody>, so cells of rows directly under <table> are matched as well
+HTML_PARSER = lhtml.HTMLParser(encoding='utf-8')
+TABLE_XPATH = etree.XPath("//table[contains(concat(' ', normalize-space(@class), ' '), ' views-table ')]")
+CELLS_XPATH = etree.XPath("tbody/tr/td | tr/td")
+
+def cell_text(cell):
+    """Text of a cell's inner HTML, stripped per text node as in the lxml fallback"""
+    return ''.join(html.unescape(part).strip() for part in TAG_RE.split(cell))
+
+def parse_rows(content):
+    """Extract table rows from page HTML, or None if the table is missing"""
+    start = content.find(TABLE_START)
+    end = content.find(TABLE_END, start) if start != -1 else -1
+    
+    if end != -1:
+        # Slice out the results table body and match rows without building a DOM
+        table = content[start:end].decode('utf-8', 'replace')
+        tbody = table.find('<tbody')
+        if tbody != -1:
+            table = table[tbody:]
+        
+        rows = [
+            [cell_text(td) for td in TD_RE.findall(tr)]
+            for tr in TR_RE.findall(table)
+        ]
+        
+        return [cols for cols in rows if cols]
+    
+    # Login and error pages never mention the table; don't parse them at all
+    if b'views-table' not in content:
+        return None
+    
+    # Markers not found verbatim: parse the full page so the table is still found.
+    # YBIO pages are UTF-8, so the parser is told so instead of sniffing a charset
+    tree = lhtml.fromstring(content, parser=HTML_PARSER)
+    
+    # Find the table
+    tables = TABLE_XPATH(tree)
+    if not tables:
+        return None
+    
+    # Extract rows: one pass over all cells in document order, grouped by their <tr>
+    return [
+        [''.join(text.strip() for text in td.itertext()) for td in cells]
+        for _, cells in itertools.groupby(CELLS_XPATH(tables[0]), key=lambda td: td.getparent())
+    ]
+
+class _PipelinedSocket:
+    """Gives each HTTPResponse the connection's shared reader so pipelined
+    responses are read back-to-back without closing the connection"""
+    def __init__(self, reader):
+        self.reader = reader
+    
+    def makefile(self, mode):
+        return self
+    
+    def readline(self, *args):
+        return self.reader.readline(*args)
+    
+    def read(self, *args):
+        return self.reader.read(*args)
+    
+    def readinto(self, b):
+        return self.reader.readinto(b)
+    
+    def close(self):
+        pass
 
 class HTMLScraper:
-    def __init__(self, from_page, to_page, max_workers, output_dir, cookie_file):
+    def __init__(self, from_page, to_page, max_workers, output_dir, cookie_file, http2=False, pipeline=0, parse_processes=0, chunk_format='csv', compress=False):
         self.from_page = from_page
         self.to_page = to_page
         self.max_workers = max_workers
         self.output_dir = output_dir
         self.cookie_file = cookie_file
+        self.http2 = http2
+        self.pipeline = pipeline
+        self.parse_processes = parse_processes
+        self.parse_pool = None  # ProcessPoolExecutor while run() is active, if enabled
+        self.chunk_format = chunk_format
+        self.compress = compress
+        self.local = threading.local()  # Per-worker pipelining connection
         self.session = requests.Session()
+        
+        # One persistent connection per worker; retries are handled in scrape_page
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=Retry(total=0))
+        self.session.mount('https://', adapter)
+        
         self.failed = []
         self.total_rows = 0
         
@@ -46,6 +161,8 @@ class HTMLScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
             'Referer': BASE_URL
         })
 
@@ -68,49 +185,43 @@ class HTMLScraper:
         else:
             print(f"⚠️  Cookie file {self.cookie_file} not found!")
 
-    def scrape_page(self, page_num):
+    def parse(self, content):
+        """Parse page content, in a worker process if a parse pool is running"""
+        if self.parse_pool is None:
+            return parse_rows(content)
+        return self.parse_pool.submit(parse_rows, content).result()
+
+    def parse_response(self, page_num, attempt, status_code, url, content):
+        """Return rows for a fetched page, None to give up, or RETRY"""
+        if status_code == 200:
+            # Check if we're redirected to login
+            if "login" in url or "shibboleth" in url:
+                print(f"⚠️  Page {page_num}: Redirected to login page!")
+                return None
+            
+            rows = self.parse(content)
+            if rows is None:
+                print(f"⚠️  Page {page_num}: Table not found (Attempt {attempt+1})")
+                return RETRY
+            return rows
+        
+        elif status_code == 403 or status_code == 401:
+            print(f"⚠️  Page {page_num}: Access Denied ({status_code})")
+            return None
+        else:
+            print(f"⚠️  Page {page_num}: Status {status_code}")
+            return RETRY
+
+    def scrape_page(self, page_num, first_attempt=0):
         """Scrape a single page and return list of rows"""
         url = f"{BASE_URL}?page={page_num}"
         
-        for attempt in range(MAX_RETRIES):
+        for attempt in range(first_attempt, MAX_RETRIES):
             try:
                 response = self.session.get(url, timeout=TIMEOUT)
-                
-                if response.status_code == 200:
-                    # Parse HTML
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Find the table
-                    table = soup.find('table', class_='views-table')
-                    
-                    if not table:
-                        # Check if we're redirected to login
-                        if "login" in response.url or "shibboleth" in response.url:
-                            print(f"⚠️  Page {page_num}: Redirected to login page!")
-                            return None
-                        
-                        print(f"⚠️  Page {page_num}: Table not found (Attempt {attempt+1})")
-                        continue
-                    
-                    # Extract rows
-                    rows = []
-                    tbody = table.find('tbody')
-                    if tbody:
-                        for tr in tbody.find_all('tr'):
-                            cols = []
-                            for td in tr.find_all('td'):
-                                cols.append(td.get_text(strip=True))
-                            if cols:
-                                rows.append(cols)
-                    
+                rows = self.parse_response(page_num, attempt, response.status_code, response.url, response.content)
+                if rows is not RETRY:
                     return rows
-                
-                elif response.status_code == 403 or response.status_code == 401:
-                    print(f"⚠️  Page {page_num}: Access Denied ({response.status_code})")
-                    return None
-                else:
-                    print(f"⚠️  Page {page_num}: Status {response.status_code}")
-                    
             except Exception as e:
                 print(f"⚠️  Page {page_num}: Error {e}")
             
@@ -118,77 +229,270 @@ class HTMLScraper:
             
         return None
 
-    def save_chunk(self, rows, chunk_id):
-        """Save a chunk of rows to CSV"""
-        if not rows:
-            return
+    def pipeline_connection(self):
+        """Return this worker's persistent connection for pipelined requests"""
+        if getattr(self.local, 'conn', None) is None:
+            parts = urlsplit(BASE_URL)
+            conn_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            conn = conn_class(parts.netloc, timeout=TIMEOUT)
+            conn.connect()
+            self.local.conn = conn
+            self.local.reader = conn.sock.makefile('rb')
+        return self.local.conn
+
+    def close_pipeline_connection(self):
+        """Drop this worker's pipelining connection"""
+        if getattr(self.local, 'conn', None) is not None:
+            self.local.reader.close()
+            self.local.conn.close()
+            self.local.conn = None
+
+    def pipeline_pages(self, pages):
+        """Send GETs for all pages back-to-back on one connection, then read the
+        responses in order. Returns {page: content} for pages answered with 200."""
+        conn = self.pipeline_connection()
+        host = urlsplit(BASE_URL).netloc
+        
+        # Session headers and cookies come from the prepared request
+        lines = []
+        prepared_requests = []
+        for page in pages:
+            prepared = self.session.prepare_request(requests.Request('GET', f"{BASE_URL}?page={page}"))
+            prepared_requests.append(prepared)
+            lines.append(f"GET {prepared.path_url} HTTP/1.1\r\nHost: {host}\r\n")
+            lines.extend(f"{k}: {v}\r\n" for k, v in prepared.headers.items())
+            lines.append("\r\n")
+        
+        fetched = {}
+        try:
+            conn.sock.sendall("".join(lines).encode('latin-1'))
+            
+            for page, prepared in zip(pages, prepared_requests):
+                response = http.client.HTTPResponse(_PipelinedSocket(self.local.reader), method='GET')
+                response.begin()
+                body = response.read()
+                
+                # Wrap like requests does: urllib3 undoes any Content-Encoding, and the
+                # original response carries Set-Cookie headers into the session's jar
+                encoding = response.getheader('Content-Encoding', 'identity')
+                wrapped = urllib3.HTTPResponse(body=io.BytesIO(body), headers={'Content-Encoding': encoding},
+                                               original_response=response)
+                requests.cookies.extract_cookies_to_jar(self.session.cookies, prepared, wrapped)
+                
+                if response.status == 200:
+                    fetched[page] = wrapped.data
+                
+                if response.will_close:
+                    # Server stopped pipelining; the rest fall back to scrape_page
+                    self.close_pipeline_connection()
+                    break
+        except (OSError, http.client.HTTPException) as e:
+            print(f"⚠️  Pages {pages[0]}-{pages[-1]}: Pipeline error {e}")
+            self.close_pipeline_connection()
+        
+        return fetched
+
+    def scrape_batch(self, pages):
+        """Scrape a batch of pages, pipelined if enabled, and return {page: rows}"""
+        fetched = {}
+        if self.pipeline:
+            try:
+                fetched = self.pipeline_pages(pages)
+            except Exception as e:
+                print(f"⚠️  Pages {pages[0]}-{pages[-1]}: Pipeline error {e}")
+                self.close_pipeline_connection()
+        
+        results = {}
+        for page in pages:
+            # Anything the pipeline didn't settle goes through the session with retries;
+            # a pipelined 200 that still needs a retry counts as the first attempt
+            if page in fetched:
+                rows = self.parse_response(page, 0, 200, f"{BASE_URL}?page={page}", fetched[page])
+                results[page] = self.scrape_page(page, first_attempt=1) if rows is RETRY else rows
+            else:
+                results[page] = self.scrape_page(page)
+        
+        return results
+
+    async def scrape_page_async(self, client, semaphore, page_num):
+        """Scrape a single page over a shared HTTP/2 client and return (page, rows)"""
+        url = f"{BASE_URL}?page={page_num}"
+        
+        for attempt in range(MAX_RETRIES):
+            try:
+                async with semaphore:
+                    response = await client.get(url)
+                args = (page_num, attempt, response.status_code, str(response.url), response.content)
+                # Waiting on the parse pool would block the event loop, so do it from a thread
+                rows = await asyncio.to_thread(self.parse_response, *args) if self.parse_pool else self.parse_response(*args)
+                if rows is not RETRY:
+                    return page_num, rows
+            except Exception as e:
+                print(f"⚠️  Page {page_num}: Error {e}")
             
-        filename = f"{self.output_dir}/chunk_{chunk_id}.csv"
+            await asyncio.sleep(1 * (attempt + 1))  # Backoff
+            
+        return page_num, None
+
+    def save_chunk(self, pages, chunk_id):
+        """Save a chunk of pages, each a list of rows, to CSV or JSON lines"""
+        filename = f"{self.output_dir}/chunk_{chunk_id}.{self.chunk_format}"
         
         # Define headers based on inspection
         headers = ['Name', 'Acronym', 'Founded', 'City', 'Country', 'Type I', 'Type II', 'UID']
         
-        with open(filename, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(rows)
+        # Chaining avoids building one flat list of rows
+        rows = itertools.chain.from_iterable(pages)
+        
+        if self.compress:
+            # Level 1 costs little CPU; the repetitive rows still shrink several-fold
+            filename += '.gz'
+            f = gzip.open(filename, 'wb', compresslevel=1)
+        else:
+            f = open(filename, 'wb', buffering=WRITE_BUFFER)
+        
+        with f:
+            if self.chunk_format == 'jsonl':
+                # One JSON array per line, header first, mirroring the CSV layout
+                f.writelines(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+                             for row in itertools.chain([headers], rows))
+            else:
+                with io.TextIOWrapper(f, encoding='utf-8', newline='') as text:
+                    writer = csv.writer(text)
+                    writer.writerow(headers)
+                    writer.writerows(rows)
+            
+        return filename
+
+    def queue_chunk(self, chunk_id):
+        """Hand the buffered pages to the I/O thread and start a new chunk"""
+        future = self.io_pool.submit(self.save_chunk, self.chunk_pages, chunk_id)
+        self.pending_saves[future] = (chunk_id, sum(map(len, self.chunk_pages)))
+        self.chunk_pages = []
+
+    def report_saves(self):
+        """Print the outcome of finished chunk saves from the dispatch thread"""
+        for future in [f for f in self.pending_saves if f.done()]:
+            chunk_id, row_count = self.pending_saves.pop(future)
+            if future.exception() is not None:
+                print(f"⚠️  Chunk {chunk_id}: Save failed {future.exception()}")
+            else:
+                print(f"✓ Saved {row_count} rows to {future.result()}")
+
+    def record_page(self, page, rows):
+        """Buffer a finished page's rows and save a chunk every CHUNK_SIZE pages"""
+        # Saves run on the I/O thread, but all output stays on this one
+        self.report_saves()
+        
+        if not rows:
+            self.failed.append(page)
+            return
+        
+        # At most one chunk of pages is held in memory; elsewhere only counts are kept
+        self.chunk_pages.append(rows)
+        self.total_rows += len(rows)
+        self.processed_count += 1
+        
+        # Save chunk if needed
+        if self.processed_count % CHUNK_SIZE == 0:
+            self.queue_chunk(f"{self.chunk_start_page}-{self.chunk_start_page + CHUNK_SIZE - 1}")
+            self.chunk_start_page += CHUNK_SIZE
             
-        print(f"✓ Saved {len(rows)} rows to {filename}")
+        if self.processed_count % 10 == 0:
+            print(f"Progress: {self.processed_count}/{(self.to_page - self.from_page + 1)} pages scraped")
+
+    def run_threaded(self):
+        """Fetch pages with a thread pool sharing the requests session"""
+        pages = list(range(self.from_page, self.to_page + 1))
+        batch_size = max(self.pipeline, 1)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Submit all tasks
+            future_to_pages = {
+                executor.submit(self.scrape_batch, pages[i:i + batch_size]): pages[i:i + batch_size]
+                for i in range(0, len(pages), batch_size)
+            }
+            
+            for future in concurrent.futures.as_completed(future_to_pages):
+                # Drop the finished future so its rows don't stay referenced until the end
+                batch = future_to_pages.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"Pages {batch[0]}-{batch[-1]} generated an exception: {e}")
+                    results = dict.fromkeys(batch)
+                for page, rows in results.items():
+                    self.record_page(page, rows)
+
+    async def run_async(self):
+        """Fetch pages concurrently, multiplexed over up to HTTP2_CONNECTIONS HTTP/2 connections"""
+        limits = httpx.Limits(max_connections=HTTP2_CONNECTIONS, max_keepalive_connections=HTTP2_CONNECTIONS)
+        # Connection-specific headers are not allowed in HTTP/2
+        headers = {k: v for k, v in self.session.headers.items() if k.lower() != 'connection'}
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=headers, cookies=self.session.cookies,
+                                     timeout=TIMEOUT, follow_redirects=True) as client:
+            async def scrape_and_record(page):
+                # Record pages as they finish so chunks are saved during the run. The task
+                # itself returns nothing, so finished tasks don't keep their rows alive
+                self.record_page(*await self.scrape_page_async(client, semaphore, page))
+            
+            await asyncio.gather(*(scrape_and_record(page) for page in range(self.from_page, self.to_page + 1)))
 
     def run(self):
         """Run the scraper"""
         print(f"Starting HTML scrape for pages {self.from_page}-{self.to_page}")
         print(f"Workers: {self.max_workers}")
+        if self.http2:
+            print(f"Transport: HTTP/2, up to {HTTP2_CONNECTIONS} connections")
+        elif self.pipeline:
+            print(f"Transport: HTTP/1.1 pipelining, {self.pipeline} pages per batch")
+        if self.parse_processes:
+            print(f"Parse processes: {self.parse_processes}")
         
         start_time = time.time()
-        all_rows = []
-        processed_count = 0
+        self.total_rows = 0
+        self.processed_count = 0
         
         # Chunk saving
-        chunk_size = 10
-        current_chunk_rows = []
-        chunk_start_page = self.from_page
+        self.chunk_pages = []
+        self.chunk_start_page = self.from_page
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_page = {
-                executor.submit(self.scrape_page, page): page 
-                for page in range(self.from_page, self.to_page + 1)
-            }
+        # Chunks are written by a single I/O thread so disk writes overlap with fetching
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.pending_saves = {}
+        
+        # Parsing is CPU-bound; a process pool lets it run alongside fetching outside the GIL.
+        # Workers start on the first submit, from a fetch thread, so they are spawned rather
+        # than forked while other threads may hold locks
+        if self.parse_processes:
+            self.parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.parse_processes, mp_context=multiprocessing.get_context('spawn'))
+        
+        try:
+            if self.http2:
+                asyncio.run(self.run_async())
+            else:
+                self.run_threaded()
             
-            for i, future in enumerate(concurrent.futures.as_completed(future_to_page)):
-                page = future_to_page[future]
-                try:
-                    rows = future.result()
-                    if rows:
-                        all_rows.extend(rows)
-                        current_chunk_rows.extend(rows)
-                        processed_count += 1
-                        
-                        # Save chunk if needed
-                        if processed_count % chunk_size == 0:
-                            self.save_chunk(current_chunk_rows, f"{chunk_start_page}-{chunk_start_page + chunk_size - 1}")
-                            current_chunk_rows = []
-                            chunk_start_page += chunk_size
-                            
-                        if processed_count % 10 == 0:
-                            print(f"Progress: {processed_count}/{(self.to_page - self.from_page + 1)} pages scraped")
-                    else:
-                        self.failed.append(page)
-                except Exception as e:
-                    print(f"Page {page} generated an exception: {e}")
-                    self.failed.append(page)
+            # Save remaining pages
+            if self.chunk_pages:
+                self.queue_chunk(f"{self.chunk_start_page}-{self.to_page}")
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
+            self.io_pool.shutdown(wait=True)
         
-        # Save remaining rows
-        if current_chunk_rows:
-            self.save_chunk(current_chunk_rows, f"{chunk_start_page}-{self.to_page}")
+        self.report_saves()
         
         duration = time.time() - start_time
         print(f"\n{'='*60}")
         print(f"Scraping Complete!")
         print(f"Time: {duration:.2f} seconds")
-        print(f"Total pages processed: {processed_count}")
-        print(f"Total rows extracted: {len(all_rows)}")
+        print(f"Total pages processed: {self.processed_count}")
+        print(f"Total rows extracted: {self.total_rows}")
         print(f"Failed pages: {len(self.failed)}")
         if self.failed:
             print(f"Failed: {self.failed}")
@@ -198,18 +502,40 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Scrape YBIO HTML tables')
     parser.add_argument('--from-page', type=int, default=1, help='Start page')
     parser.add_argument('--to-page', type=int, default=3945, help='End page')
-    parser.add_argument('--workers', type=int, default=10, help='Max workers')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Max concurrent requests (default: {DEFAULT_WORKERS}; above {RATE_LIMIT_WORKERS} gets rate limited)')
     parser.add_argument('--output-dir', type=str, default='ybio_html_data', help='Output directory')
     parser.add_argument('--cookies', type=str, default='cookies.pkl', help='Cookie file')
+    parser.add_argument('--http2', action='store_true', help='Use async HTTP/2 (httpx) instead of threads')
+    parser.add_argument('--pipeline', type=int, default=0, help='Pipeline this many requests per connection (HTTP/1.1, 0 disables)')
+    parser.add_argument('--parse-processes', type=int, nargs='?', default=0, const=os.cpu_count() or 1,
+                        help='Parse pages in worker processes (one per CPU if no count is given)')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help='Chunk file format (jsonl is written with orjson)')
+    parser.add_argument('--gzip', action='store_true', help='Gzip chunk files (compression level 1)')
     
     args = parser.parse_args()
     
+    if args.pipeline < 0:
+        parser.error('--pipeline must be 0 (disabled) or a positive batch size')
+    if args.http2 and args.pipeline:
+        parser.error('--pipeline applies to HTTP/1.1 connections and cannot be combined with --http2')
+    if args.parse_processes < 0:
+        parser.error('--parse-processes must be 0 (disabled) or a positive process count')
+    
+    if args.workers > RATE_LIMIT_WORKERS:
+        print(f"⚠️  {args.workers} workers is above {RATE_LIMIT_WORKERS}; expect 429s from the proxy")
+    
     scraper = HTMLScraper(
         from_page=args.from_page,
         to_page=args.to_page,
         max_workers=args.workers,
         output_dir=args.output_dir,
-        cookie_file=args.cookies
+        cookie_file=args.cookies,
+        http2=args.http2,
+        pipeline=args.pipeline,
+        parse_processes=args.parse_processes,
+        chunk_format=args.format,
+        compress=args.gzip
     )
     
     scraper.run()
@@ -9,8 +9,23 @@ Email: diwas.puri@duke.edu
 
 import os
 import re
+import gzip
 from pathlib import Path
 
+BLOCK_SIZE = 1 << 20  # 1 MiB
+
+def count_lines(path):
+    """Count newlines in a file by scanning it in binary blocks, decompressing .gz files"""
+    count = 0
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        while True:
+            block = f.read(BLOCK_SIZE)
+            if not block:
+                break
+            count += block.count(b'\n')
+    return count
+
 def analyze_coverage(data_dir="../data/raw_chunks", total_pages=3945):
     print(f"Analyzing coverage in {data_dir}...")
     
@@ -21,13 +36,14 @@ def analyze_coverage(data_dir="../data/raw_chunks", total_pages=3945):
 
     # Track covered pages
     covered_pages = set()
-    files = list(path.glob("chunk_*.csv"))
+    files = [f for pattern in ("chunk_*.csv", "chunk_*.jsonl", "chunk_*.csv.gz", "chunk_*.jsonl.gz")
+             for f in path.glob(pattern)]
     
     print(f"Found {len(files)} chunk files.")
     
     for file in files:
-        # Extract range from filename chunk_START-END.csv
-        match = re.search(r'chunk_(\d+)-(\d+)\.csv', file.name)
+        # Extract range from filename chunk_START-END.csv (or .jsonl, optionally .gz)
+        match = re.search(r'chunk_(\d+)-(\d+)\.(?:csv|jsonl)(?:\.gz)?$', file.name)
         if match:
             start = int(match.group(1))
             end = int(match.group(2))
@@ -41,9 +57,8 @@ def analyze_coverage(data_dir="../data/raw_chunks", total_pages=3945):
             # Actually, the scraper saves "current_chunk_rows" to "chunk_start_page - current_page".
             # But let's verify row counts to be sure.
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    # Subtract 1 for header
-                    row_count = sum(1 for _ in f) - 1
+                # Subtract 1 for header
+                row_count = count_lines(file) - 1
                 
                 if row_count > 0:
                     # If we have rows, we assume the pages in that range are covered.
@@ -87,7 +102,7 @@ def analyze_coverage(data_dir="../data/raw_chunks", total_pages=3945):
         print("\nTo retry missing pages, run:")
         cmd_parts = []
         for start, end in ranges:
-            print(f"python scrape_html_table.py --from-page {start} --to-page {end} --workers 5 --output-dir ybio_html_data")
+            print(f"python scrape_html_table.py --from-page {start} --to-page {end} --output-dir ybio_html_data")
 
 if __name__ == "__main__":
     analyze_coverage()
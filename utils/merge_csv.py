@@ -10,6 +10,39 @@ Email: diwas.puri@duke.edu
 import os
 from pathlib import Path
 import re
+import io
+import gzip
+import csv
+import orjson
+import xxhash
+
+BUFFER_SIZE = 1 << 20  # 1 MiB file buffers to cut read/write syscalls
+
+CHUNK_PATTERNS = ["*.csv", "*.jsonl", "*.csv.gz", "*.jsonl.gz"]
+
+# Matches organizations_X-Y and chunk_X-Y file names
+PAGE_RANGE_RE = re.compile(r'(?:organizations|chunk)_(\d+)-\d+')
+
+def get_page_range(filename):
+    """Return the first page in a file name's page range, or 0 if it has none"""
+    match = PAGE_RANGE_RE.search(filename)
+    return int(match.group(1)) if match else 0
+
+def count_csv_rows(block, in_quotes=False):
+    """Count CSV records ending in a block, skipping newlines inside quoted fields.
+    Returns the count and whether the block ends inside a quoted field."""
+    if not in_quotes and b'"' not in block:
+        return block.count(b'\n'), False
+    
+    # Escaped quotes are doubled, so an odd number of quotes flips the state
+    count = 0
+    lines = block.split(b'\n')
+    for line in lines[:-1]:
+        in_quotes ^= line.count(b'"') % 2 == 1
+        if not in_quotes:
+            count += 1
+    in_quotes ^= lines[-1].count(b'"') % 2 == 1
+    return count, in_quotes
 
 def merge_csv_files(data_dirs=None, output_file="organizations_merged.csv"):
     """Merge all CSV files from directories into one"""
@@ -22,8 +55,8 @@ def merge_csv_files(data_dirs=None, output_file="organizations_merged.csv"):
     for data_dir in data_dirs:
         data_path = Path(data_dir)
         if data_path.exists():
-            # Find all CSV files (excluding the merged file if it exists)
-            files = [f for f in data_path.glob("*.csv") if 'merged' not in f.name and 'complete' not in f.name and 'deduped' not in f.name]
+            # Find all CSV and JSON-lines chunk files, gzipped or not (excluding the merged file if it exists)
+            files = [f for pattern in CHUNK_PATTERNS for f in data_path.glob(pattern) if 'merged' not in f.name and 'complete' not in f.name and 'deduped' not in f.name]
             csv_files.extend(files)
             print(f"Found {len(files)} files in {data_dir}/")
     
@@ -32,20 +65,7 @@ def merge_csv_files(data_dirs=None, output_file="organizations_merged.csv"):
         return
     
     # Sort files by page range for logical order
-    def get_page_range(filename):
-        # Try organizations_X-Y pattern
-        match = re.search(r'organizations_(\d+)-(\d+)', filename.name)
-        if match:
-            return int(match.group(1))
-        
-        # Try chunk_X-Y pattern
-        match = re.search(r'chunk_(\d+)-(\d+)', filename.name)
-        if match:
-            return int(match.group(1))
-            
-        return 0
-    
-    csv_files = sorted(csv_files, key=get_page_range)
+    csv_files = sorted(csv_files, key=lambda f: get_page_range(f.name))
     
     print(f"\n{'='*60}")
     print(f"Merging {len(csv_files)} CSV file(s)...")
@@ -55,29 +75,58 @@ def merge_csv_files(data_dirs=None, output_file="organizations_merged.csv"):
     total_rows = 0
     header_written = False
     
-    with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+    # Binary mode: CSV rows are copied as-is without decoding and re-encoding
+    with open(output_path, 'wb', buffering=BUFFER_SIZE) as outfile:
+        # JSON-lines chunks are converted to CSV through a text view of the same file
+        text_out = io.TextIOWrapper(outfile, encoding='utf-8', newline='', write_through=True)
+        writer = csv.writer(text_out)
+        
         for i, csv_file in enumerate(csv_files, 1):
             print(f"[{i}/{len(csv_files)}] Processing {csv_file.name}...", end=' ')
             
-            with open(csv_file, 'r', encoding='utf-8') as infile:
-                lines = infile.readlines()
+            is_jsonl = '.jsonl' in csv_file.suffixes
+            if csv_file.suffix == '.gz':
+                infile = gzip.open(csv_file, 'rb')
+            else:
+                infile = open(csv_file, 'rb', buffering=BUFFER_SIZE)
+            
+            with infile:
+                header = infile.readline()
                 
-                if not lines:
+                if not header:
                     print("(empty)")
                     continue
                 
                 # Write header only once
                 if not header_written:
-                    outfile.write(lines[0])
+                    if is_jsonl:
+                        writer.writerow(orjson.loads(header))
+                    else:
+                        outfile.write(header)
                     header_written = True
                 
-                # Write data rows (skip header)
-                data_rows = lines[1:]
-                outfile.write(''.join(data_rows))
+                row_count = 0
+                if is_jsonl:
+                    # Convert each JSON array row to CSV
+                    for line in infile:
+                        writer.writerow(orjson.loads(line))
+                        row_count += 1
+                else:
+                    # Copy data rows (skip header) in fixed-size blocks, counting rows as we go
+                    in_quotes = False
+                    while True:
+                        block = infile.read(BUFFER_SIZE)
+                        if not block:
+                            break
+                        outfile.write(block)
+                        block_rows, in_quotes = count_csv_rows(block, in_quotes)
+                        row_count += block_rows
                 
-                row_count = len(data_rows)
                 total_rows += row_count
                 print(f"({row_count:,} rows)")
+        
+        # Leave outfile to be closed by its own with-block
+        text_out.detach()
     
     print(f"\n{'='*60}")
     print(f"✅ Merge complete!")
@@ -97,26 +146,26 @@ def deduplicate_csv(input_file, output_file=None):
     print(f"Deduplicating {input_file}...")
     print(f"{'='*60}\n")
     
+    # Only 64-bit fingerprints of lines are kept in memory; unique rows are streamed out
     seen = set()
-    unique_rows = []
+    unique_count = 0
     duplicates = 0
     
-    with open(input_file, 'r', encoding='utf-8') as f:
-        header = f.readline()
-        unique_rows.append(header)
+    with open(input_file, 'rb', buffering=BUFFER_SIZE) as infile, \
+         open(output_file, 'wb', buffering=BUFFER_SIZE) as outfile:
+        outfile.write(infile.readline())
         
-        for line in f:
-            if line in seen:
+        for line in infile:
+            fingerprint = xxhash.xxh3_64_intdigest(line)
+            if fingerprint in seen:
                 duplicates += 1
             else:
-                seen.add(line)
-                unique_rows.append(line)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(unique_rows)
+                seen.add(fingerprint)
+                outfile.write(line)
+                unique_count += 1
     
-    print(f"Original rows: {len(unique_rows) + duplicates - 1:,}")
-    print(f"Unique rows: {len(unique_rows) - 1:,}")
+    print(f"Original rows: {unique_count + duplicates:,}")
+    print(f"Unique rows: {unique_count:,}")
     print(f"Duplicates removed: {duplicates:,}")
     print(f"Output file: {output_file}")
     print(f"{'='*60}\n")